@@ -8,6 +8,7 @@ import streamlit as st
 import pandas as pd
 import json
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 try:
 	import plotly.express as px
@@ -50,6 +51,13 @@ def load_token_data():
 		st.warning(f"Could not load token data: {e}")
 		return {}
 
+@st.cache_resource
+def get_report_generator():
+	"""One ReportGenerator shared by the whole process (cache_resource is
+	global, not per-session) so its result cache survives reruns; the cache
+	itself is LRU-bounded so long-lived servers don't accumulate exports."""
+	return ReportGenerator()
+
 def main():
 	st.set_page_config(
 		page_title="DAO Accounting Reports",
@@ -341,24 +349,32 @@ def main():
 			progress_bar = st.progress(0)
 			status_text = st.empty()
             
-			for i, (name, address) in enumerate(subunits.items()):
-				status_text.text(f"Fetching data for {name}...")
-				try:
-					proposals = api_client.get_proposals(address)
-					st.session_state.proposal_data[name] = {
-						'address': address,
-						'proposals': proposals
-					}
-					st.success(f"✅ Fetched {len(proposals)} proposals for {name}")
-				except Exception as e:
-					st.error(f"❌ Error fetching data for {name}: {str(e)}")
-					st.session_state.proposal_data[name] = {
-						'address': address,
-						'proposals': [],
-						'error': str(e)
-					}
-                
-				progress_bar.progress((i + 1) / len(subunits))
+			# Fetch all sub-DAOs concurrently: the calls are independent and
+			# I/O-bound, so total wall time is the slowest request instead of
+			# the sum of all of them. The client's pooled session handles the
+			# parallel GETs.
+			status_text.text(f"Fetching data for {len(subunits)} sub-units...")
+			with ThreadPoolExecutor(max_workers=min(8, len(subunits))) as pool:
+				futures = {pool.submit(api_client.get_proposals, address): (name, address)
+						   for name, address in subunits.items()}
+				for i, future in enumerate(as_completed(futures)):
+					name, address = futures[future]
+					try:
+						proposals = future.result()
+						st.session_state.proposal_data[name] = {
+							'address': address,
+							'proposals': proposals
+						}
+						st.success(f"✅ Fetched {len(proposals)} proposals for {name}")
+					except Exception as e:
+						st.error(f"❌ Error fetching data for {name}: {str(e)}")
+						st.session_state.proposal_data[name] = {
+							'address': address,
+							'proposals': [],
+							'error': str(e)
+						}
+
+					progress_bar.progress((i + 1) / len(subunits))
             
 			status_text.text("Processing data...")
             
@@ -366,6 +382,7 @@ def main():
 			if st.session_state.proposal_data:
 				processor = DataProcessor(core_team_addresses, st.session_state.token_data)
 				processed_res = processor.process_all_proposals(st.session_state.proposal_data)
+				st.session_state.processing_diagnostics = getattr(processor, 'diagnostics', None)
 				# Ensure we always store a pandas DataFrame in session state
 				try:
 					if not isinstance(processed_res, pd.DataFrame):
@@ -434,7 +451,7 @@ def main():
 	if processed_data_available:
 		st.subheader("📊 Accounting Report")
         
-		report_generator = ReportGenerator()
+		report_generator = get_report_generator()
         
 		# Generate summary statistics and insights
 		summary_stats = report_generator.generate_summary_stats(st.session_state.processed_data)
@@ -493,7 +510,7 @@ def main():
 			subunit_summary = pd.DataFrame()
 
 		if not subunit_summary.empty:
-			st.dataframe(subunit_summary, use_container_width=True)
+			st.dataframe(subunit_summary, column_config={'Total USD': st.column_config.NumberColumn(format='%.2f'), 'Average USD': st.column_config.NumberColumn(format='%.2f')}, use_container_width=True)
 			if HAS_PLOTLY:
 				try:
 					fig_pie = px.pie(
@@ -517,7 +534,7 @@ def main():
 			if not category_breakdown.empty:
 				col1, col2 = st.columns(2)
 				with col1:
-					st.dataframe(category_breakdown, use_container_width=True)
+					st.dataframe(category_breakdown, column_config={'Total USD': st.column_config.NumberColumn(format='%.2f')}, use_container_width=True)
 				with col2:
 					if HAS_PLOTLY:
 						try:
@@ -539,7 +556,7 @@ def main():
 			if not amount_analysis.empty:
 				col1, col2 = st.columns(2)
 				with col1:
-					st.dataframe(amount_analysis, use_container_width=True)
+					st.dataframe(amount_analysis, column_config={'Total USD': st.column_config.NumberColumn(format='%.2f')}, use_container_width=True)
 				with col2:
 					if HAS_PLOTLY:
 						try:
@@ -563,7 +580,7 @@ def main():
 				core_breakdown = report_generator.generate_core_team_breakdown(st.session_state.processed_data)
 				col1, col2 = st.columns(2)
 				with col1:
-					st.dataframe(core_breakdown, use_container_width=True)
+					st.dataframe(core_breakdown, column_config={'Total USD': st.column_config.NumberColumn(format='%.2f')}, use_container_width=True)
 				with col2:
 					if HAS_PLOTLY:
 						try:
@@ -587,31 +604,18 @@ def main():
 			if 'Transaction Tag' in st.session_state.processed_data.columns:
 				st.subheader("Transaction Tags Analysis")
 
-				# Expand tags and analyze
-				tags_data = []
-				for _, row in st.session_state.processed_data.iterrows():
-					tag_value = row['Transaction Tag']
-					if isinstance(tag_value, str):
-						tags = tag_value.split(' | ')
-					else:
-						tags = [str(tag_value)]
-					for tag in tags:
-						tags_data.append({
-							'Tag': tag,
-							'USD Value': row['USD Value'],
-							'Sub-unit': row['Sub-unit']
-						})
-
-				if tags_data:
-					tags_df = pd.DataFrame(tags_data)
-					tag_summary = tags_df.groupby('Tag').agg({
-						'USD Value': ['sum', 'count']
-					}).round(2)
-					tag_summary.columns = ['Total USD', 'Count']
+				# Expand tags with one vectorized split + explode instead of
+				# building per-row dicts through iterrows
+				tags = st.session_state.processed_data['Transaction Tag'].astype(str).str.split(' | ', regex=False)
+				exploded = st.session_state.processed_data[['USD Value', 'Sub-unit']].assign(Tag=tags).explode('Tag')
+
+				if not exploded.empty:
+					tag_summary = exploded.groupby('Tag', sort=False).agg(
+						**{'Total USD': ('USD Value', 'sum'), 'Count': ('USD Value', 'count')})
 					tag_summary = tag_summary.reset_index().sort_values('Total USD', ascending=False)
 					col1, col2 = st.columns(2)
 					with col1:
-						st.dataframe(tag_summary, use_container_width=True)
+						st.dataframe(tag_summary, column_config={'Total USD': st.column_config.NumberColumn(format='%.2f')}, use_container_width=True)
 					with col2:
 						if HAS_PLOTLY:
 							try:
@@ -638,18 +642,21 @@ def main():
 				col1, col2, col3 = st.columns(3)
 
 				with col1:
+					# One C-level unique pass feeds both options and default
+					org_unit_options = pd.unique(detailed_transactions['Org Unit'].dropna())
 					selected_org_units = st.multiselect(
 						"Filter by Org Unit",
-						options=detailed_transactions['Org Unit'].unique(),
-						default=detailed_transactions['Org Unit'].unique()
+						options=org_unit_options,
+						default=org_unit_options
 					)
 
 				with col2:
 					if 'Transaction Category' in detailed_transactions.columns:
+						category_options = pd.unique(detailed_transactions['Transaction Category'].dropna())
 						selected_categories = st.multiselect(
 							"Filter by Transaction Category",
-							options=detailed_transactions['Transaction Category'].unique(),
-							default=detailed_transactions['Transaction Category'].unique()
+							options=category_options,
+							default=category_options
 						)
 					else:
 						selected_categories = []
@@ -681,7 +688,7 @@ def main():
 				col1, col2 = st.columns(2)
 
 				with col1:
-					csv_data = filtered_transactions.to_csv(index=False)
+					csv_data = report_generator.export_to_csv(filtered_transactions)
 					st.download_button(
 						label="📥 Download as CSV",
 						data=csv_data,
@@ -690,7 +697,7 @@ def main():
 					)
 
 				with col2:
-					json_data = filtered_transactions.to_json(orient='records', indent=2)
+					json_data = report_generator.export_to_json(filtered_transactions)
 					if json_data:
 						st.download_button(
 							label="📥 Download as JSON",
@@ -1,38 +1,37 @@
-import csv
-import json
-
-PAGE_CSV = "page_osmo_daily_prices.csv"
-OSMO_SECRET_CSV = "osmo_secret_daily_prices.csv"
-OUTPUT_JSON = "combined_daily_prices.json"
-
-result = []
-
-# Read PAGE prices
-with open(PAGE_CSV, newline="") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        result.append({
-            "date": row["date"],
-            "token": "PAGE",
-            "price": float(row["price"])
-        })
-
-# Read OSMO/SECRET prices
-with open(OSMO_SECRET_CSV, newline="") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        # Try to find the right column for symbol and price
-        symbol = row.get("symbol") or row.get("token") or row.get("Symbol")
-        price = row.get("AVG_DAILY_PRICE") or row.get("price")
-        if symbol and price:
-            result.append({
-                "date": row["date"],
-                "token": symbol,
-                "price": float(price)
-            })
-
-# Output as JSON
-with open(OUTPUT_JSON, "w") as f:
-    json.dump(result, f, indent=2)
-
-print(f"Combined data written to {OUTPUT_JSON}")
+import pandas as pd
+
+PAGE_CSV = "page_osmo_daily_prices.csv"
+OSMO_SECRET_CSV = "osmo_secret_daily_prices.csv"
+OUTPUT_JSON = "combined_daily_prices.json"
+
+COLUMNS = ["date", "token", "price"]
+
+
+def main():
+    # pandas' C parser reads the files into contiguous float arrays instead
+    # of csv.DictReader building a dict and calling float() per row.
+    page = pd.read_csv(PAGE_CSV, usecols=["date", "price"])
+    page["token"] = "PAGE"
+
+    # Normalize headers case-insensitively: the export writes DATE/SYMBOL/
+    # AVG_DAILY_PRICE, but lower-casing first keeps any casing working.
+    other = pd.read_csv(OSMO_SECRET_CSV)
+    other.columns = other.columns.str.lower()
+    other = other.rename(columns={"symbol": "token", "avg_daily_price": "price"})
+    if all(c in other.columns for c in COLUMNS):
+        other = other.dropna(subset=["token", "price"])[COLUMNS]
+        # The export carries full ISO timestamps; reduce to the date part the
+        # combined file uses
+        other["date"] = other["date"].astype(str).str.slice(0, 10)
+    else:
+        other = pd.DataFrame(columns=COLUMNS)
+
+    combined = pd.concat([page[COLUMNS], other], ignore_index=True)
+    combined["price"] = combined["price"].astype(float)
+    combined.to_json(OUTPUT_JSON, orient="records", indent=2)
+
+    print(f"Combined data written to {OUTPUT_JSON} ({len(combined)} records)")
+
+
+if __name__ == "__main__":
+    main()
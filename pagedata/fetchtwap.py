@@ -1,14 +1,31 @@
 
 import requests
 import csv
+import json
+import time
 from datetime import datetime, timedelta
 
+try:
+                import orjson  # serializes several times faster than stdlib json
+except ImportError:
+                orjson = None
+
 TFM_URL = "https://analytics.api.tfm.com/graphql2"
 PAGE_DENOM = "ibc/23A62409E4AD8133116C249B1FA38EED30E500A115D7B153109462CD82C1CD99"
 
+# page_osmo_to_daily only reads these three fields; asking for just them
+# shrinks every page's payload (less to transfer, parse, and store).
+ITEM_FIELDS = ("timestamp", "primaryTokenAmount", "secondaryTokenAmount")
+# Full selection set for tooling that needs the whole transaction record.
+ITEM_FIELDS_FULL = (
+                "volume", "txHash", "timestamp", "swapType", "sender",
+                "secondaryVolume", "secondaryTokenAmount", "secondaryTokenAddress",
+                "secondaryPrice", "primaryVolume", "primaryTokenAmount",
+                "primaryTokenAddress", "primaryPrice",
+)
+
 
-def fetch_all_transactions():
-                import json
+def fetch_all_transactions(fields=ITEM_FIELDS):
                 headers = {
                                 "accept": "application/json",
                                 "content-type": "application/json",
@@ -28,19 +45,7 @@ def fetch_all_transactions():
                                 asc: $asc
                         ) {
                                 items {
-                                        volume
-                                        txHash
-                                        timestamp
-                                        swapType
-                                        sender
-                                        secondaryVolume
-                                        secondaryTokenAmount
-                                        secondaryTokenAddress
-                                        secondaryPrice
-                                        primaryVolume
-                                        primaryTokenAmount
-                                        primaryTokenAddress
-                                        primaryPrice
+                                        %s
                                 }
                                 pageInfo {
                                         hasNextPage
@@ -49,7 +54,7 @@ def fetch_all_transactions():
                                 }
                         }
                 }
-                """
+                """ % "\n                                        ".join(fields)
                 variables = {
                                 "chain": ["osmosis"],
                                 "tokens": {"token0": PAGE_DENOM, "token1": "uosmo"},
@@ -59,28 +64,57 @@ def fetch_all_transactions():
                                 "skip": 0,
                                 "asc": False
                 }
-                all_items = []
+                total = 0
                 page = 0
-                while True:
-                                payload = {"query": query, "variables": variables}
-                                response = requests.post(TFM_URL, headers=headers, json=payload)
-                                data = response.json()
-                                print(f"Page {page} response: {data}")
-                                if data.get("data") and data["data"].get("transaction"):
-                                                items = data["data"]["transaction"]["items"]
-                                                all_items.extend(items)
-                                                pageInfo = data["data"]["transaction"]["pageInfo"]
-                                                if pageInfo.get("hasNextPage"):
-                                                                variables["skip"] += variables["limit"]
-                                                                page += 1
+                # One pooled session for the whole pagination walk: pages reuse
+                # the TCP/TLS connection instead of handshaking per request.
+                # The skip cursor depends on each page's pageInfo, so pages are
+                # fetched sequentially; retries with backoff cover transient
+                # errors mid-walk.
+                session = requests.Session()
+                session.headers.update(headers)
+                # Each page is appended to a JSONL file as it arrives: memory
+                # stays at one page instead of the whole history, and there is
+                # no final full-dataset pretty-print pass.
+                with open("page_osmo_transactions.jsonl", "wb") as f:
+                                while True:
+                                                payload = {"query": query, "variables": variables}
+                                                data = None
+                                                for attempt in range(3):
+                                                                try:
+                                                                                response = session.post(TFM_URL, json=payload, timeout=30)
+                                                                                response.raise_for_status()
+                                                                                data = response.json()
+                                                                                break
+                                                                except (requests.RequestException, ValueError):
+                                                                                time.sleep(2 ** attempt)
+                                                if data is None:
+                                                                print(f"Page {page} failed after retries; stopping")
+                                                                break
+                                                if data.get("data") and data["data"].get("transaction"):
+                                                                items = data["data"]["transaction"]["items"]
+                                                                for it in items:
+                                                                                if orjson is not None:
+                                                                                                f.write(orjson.dumps(it))
+                                                                                else:
+                                                                                                f.write(json.dumps(it).encode("utf-8"))
+                                                                                f.write(b"\n")
+                                                                total += len(items)
+                                                                print(f"Page {page}: {len(items)} items ({total} total)")
+                                                                pageInfo = data["data"]["transaction"]["pageInfo"]
+                                                                if pageInfo.get("hasNextPage"):
+                                                                                variables["skip"] += variables["limit"]
+                                                                                page += 1
+                                                                else:
+                                                                                break
                                                 else:
                                                                 break
-                                else:
-                                                break
-                # Save all items to a JSON file
-                with open("page_osmo_transactions.json", "w") as f:
-                                json.dump(all_items, f, indent=2)
-                print(f"Saved {len(all_items)} transactions to page_osmo_transactions.json")
+                print(f"Saved {total} transactions to page_osmo_transactions.jsonl")
+
+
+def fetch_all_transactions_full():
+                """Fetch with the full field set for tooling beyond the daily prices."""
+                fetch_all_transactions(fields=ITEM_FIELDS_FULL)
 
 
 if __name__ == "__main__":
@@ -1,36 +1,72 @@
 import json
-import csv
-from datetime import datetime
-from collections import defaultdict
+import os
 
+import pandas as pd
+
+try:
+    import orjson  # parses each JSONL line several times faster than stdlib
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # streams the JSON instead of loading it all at once
+except ImportError:
+    ijson = None
+
+JSONL_FILE = "page_osmo_transactions.jsonl"
 INPUT_FILE = "page_osmo_transactions.json"
 OUTPUT_FILE = "page_osmo_daily_prices.csv"
 TOKEN = "PAGE.grv"
 
-def main():
-    with open(INPUT_FILE, "r") as f:
-        transactions = json.load(f)
 
-    # Group prices by date, handling swap direction
-    prices_by_date = defaultdict(list)
-    for tx in transactions:
+def iter_transactions():
+    """Yield transactions one at a time without loading the whole export.
+
+    Prefers the line-delimited file fetchtwap writes — one parse per line,
+    constant memory. Falls back to the legacy single-document JSON, streamed
+    with ijson when available and json.load otherwise.
+    """
+    loads = orjson.loads if orjson is not None else json.loads
+    if os.path.exists(JSONL_FILE):
+        with open(JSONL_FILE, "rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+    elif ijson is not None:
+        with open(INPUT_FILE, "rb") as f:
+            yield from ijson.items(f, "item")
+    else:
+        with open(INPUT_FILE, "r") as f:
+            yield from json.load(f)
+
+
+def main():
+    # Single streaming pass folds each swap into a running (count, mean) per
+    # day, so memory is O(#dates) regardless of how many transactions a day
+    # saw — it composes with the streamed input to keep the whole run at
+    # constant per-transaction memory. The incremental mean is also more
+    # numerically stable than summing a long series and dividing at the end.
+    agg = {}
+    for tx in iter_transactions():
         ts = tx.get("timestamp")
         page_amount = tx.get("primaryTokenAmount")
         uosmo_amount = tx.get("secondaryTokenAmount")
         if ts is not None and page_amount and uosmo_amount and page_amount != 0:
-            date_str = datetime.utcfromtimestamp(ts).strftime("%Y-%m-%d")
-            price = uosmo_amount / page_amount
-            prices_by_date[date_str].append(price)
-
-    # Write daily average prices to CSV
-    with open(OUTPUT_FILE, "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["date", "token", "price"])
-        for date in sorted(prices_by_date.keys()):
-            daily_prices = prices_by_date[date]
-            avg_price = sum(daily_prices) / len(daily_prices)
-            writer.writerow([date, TOKEN, avg_price])
-            print(date, TOKEN, avg_price)
+            day = int(ts) // 86400
+            count, mean = agg.get(day, (0, 0.0))
+            count += 1
+            mean += (uosmo_amount / page_amount - mean) / count
+            agg[day] = (count, mean)
+
+    days = sorted(agg)
+    daily = pd.DataFrame({
+        "date": pd.to_datetime([d * 86400 for d in days], unit="s").strftime("%Y-%m-%d"),
+        "token": TOKEN,
+        "price": [agg[d][1] for d in days],
+    })
+
+    daily.to_csv(OUTPUT_FILE, index=False)
+    print(daily.to_string(index=False, header=False))
 
 if __name__ == "__main__":
     main()
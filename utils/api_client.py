@@ -1,13 +1,25 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class DAOAPIClient:
 	def __init__(self, base_url: str, network: str = 'osmosis-1'):
 		self.base_url = base_url.rstrip('/')
 		self.network = network
+		# One pooled session for all calls: connections are kept alive across
+		# requests instead of paying a TCP/TLS handshake per endpoint, and
+		# transient server/rate-limit errors retry with backoff.
+		self._session = requests.Session()
+		retry = Retry(total=3, backoff_factor=0.5,
+					  status_forcelist=(429, 500, 502, 503, 504),
+					  allowed_methods=('GET',))
+		adapter = HTTPAdapter(max_retries=retry)
+		self._session.mount('https://', adapter)
+		self._session.mount('http://', adapter)
 
 	def _get(self, path: str, params=None, timeout=15):
 		url = f"{self.base_url}{path}"
-		r = requests.get(url, params=params or {}, timeout=timeout)
+		r = self._session.get(url, params=params or {}, timeout=timeout)
 		r.raise_for_status()
 		return r.json()
 
@@ -34,4 +46,4 @@ class DAOAPIClient:
 		try:
 			return self._get(f"/daos/{dao_address}/members")
 		except Exception:
-			return []
\ No newline at end of file
+			return []
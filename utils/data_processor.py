@@ -1,17 +1,200 @@
+import bisect
+import sys
+import types
 import pandas as pd
+import numpy as np
 import json
 import os
+import re
+from binascii import a2b_base64 as _b64decode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses JSON 2-4x faster than the stdlib and accepts bytes directly;
+# fall back to json.loads when it isn't installed.
+try:
+	import orjson
+	_json_loads = orjson.loads
+except Exception:
+	orjson = None
+	_json_loads = json.loads
+
+# ijson streams large documents without materializing them; optional like orjson.
+try:
+	import ijson
+except Exception:
+	ijson = None
+
+# Compiled once at module scope: these scan every otherwise-unhandled message,
+# so keep the patterns out of the per-message path.
+_ADDR_RE = re.compile(r'osmo1[a-z0-9]{38,58}')
+_AMT_RE = re.compile(r'(\d+)(uosmo|ibc/[0-9A-F]{64})')
+_NON_ALNUM_RE = re.compile(r'[^A-Za-z0-9]')
+# Message types excluded from accounting rows, as one alternation matched by
+# substring (the API decorates the base type, e.g. with full proto URLs).
+# Extend the tuple to filter more types; the pattern still compiles once.
+_FILTERED_MSG_RE = re.compile('|'.join(map(re.escape, ('wasm_execute_funds',))))
+
+
+# Amount-band labels indexed by np.digitize bucket
+_AMOUNT_TAG_LABELS = np.array(['Small', 'Medium', 'Large', 'Very Large'])
+_AMOUNT_TAG_EDGES = [100, 1000, 10000]
+# USD range bins shared with the report generator's range analysis
+_USD_RANGE_BINS = [0, 100, 1000, 10000, 100000, 1_000_000_000]
+_USD_RANGE_LABELS = ['0-100', '100-1k', '1k-10k', '10k-100k', '100k+']
+
+# Frozen module-level maps instead of per-call dict literals: denom aliases
+# that resolve to a pricing symbol, and the Coingecko ids the fallback needs
+# (it takes ids like 'osmosis', not ticker symbols).
+_SYMBOL_ALIASES = types.MappingProxyType({
+	'uosmo': 'OSMO',
+	'osmo': 'OSMO',
+	'uscrt': 'SCRT',
+	'scrt': 'SCRT',
+	'page.grv': 'PAGE',
+	'upage': 'PAGE',
+})
+_CG_ID_MAP = types.MappingProxyType({
+	'OSMO': 'osmosis',
+	'SCRT': 'secret',
+	'PAGE': 'page',
+})
+
+# Column order shared by the per-proposal extractor and the final DataFrame
+_PAYMENT_COLUMNS = (
+	'Proposal Date',
+	'Date Key',
+	'Proposal ID',
+	'Proposal Title',
+	'Sub-unit',
+	'Org Unit',
+	'Recipient',
+	'Message Type',
+	'Token Raw Amount',
+	'Token Denom',
+)
+
+
+def _first(d, keys, default=None):
+	"""Return the first truthy value of d[key] across keys."""
+	for k in keys:
+		v = d.get(k)
+		if v:
+			return v
+	return default
+
+
+def _as_float(value):
+	"""Coerce a JSON number (or numeric string) to float, else None.
+
+	The isinstance fast path keeps hot pricing lookups from ever entering a
+	try frame; only string inputs can raise, and only ValueError is caught.
+	"""
+	if isinstance(value, (int, float)):
+		return float(value)
+	if isinstance(value, str):
+		try:
+			return float(value)
+		except ValueError:
+			return None
+	return None
+
+
+def _iter_str_leaves(obj):
+	"""Yield every string leaf of a nested dict/list message payload.
+
+	Iterative on an explicit stack: deeply nested indexer payloads would
+	otherwise cost a Python frame per nesting level.
+	"""
+	stack = [obj]
+	while stack:
+		node = stack.pop()
+		if isinstance(node, str):
+			yield node
+		elif isinstance(node, dict):
+			# only queue nodes worth visiting; numbers/None/bools never
+			# contribute a leaf, so don't pay the push/pop for them
+			for v in node.values():
+				if isinstance(v, (str, dict, list)):
+					stack.append(v)
+		elif isinstance(node, list):
+			for v in node:
+				if isinstance(v, (str, dict, list)):
+					stack.append(v)
 
 class DataProcessor:
+	# Proposals per accumulator flush in process_all_proposals
+	_chunk_size = 500
+
 	def __init__(self, core_team_addresses=None, token_data=None):
 		self.core_team_addresses = set(core_team_addresses or [])
 		self.token_data = token_data or {}
 		self.price_cache = {}
+		# Lazily-built pricing index: per-symbol price dict plus sorted date
+		# keys and their ordinals, parsed once instead of per lookup.
+		self._price_index = None
+		# Flattened pricing table reused by every asof merge (see _prices_table)
+		self._prices_df = None
+		# Raw combined pricing dict; both derived views above are built from
+		# this, so the JSON files are read from disk at most once per processor.
+		self._combined_prices = None
+		# Pooled HTTP session for the Coingecko fallback: keep-alive reuse
+		# instead of a fresh TCP/TLS handshake per lookup.
+		self._http = requests.Session()
+		self._http.headers.update({'accept': 'application/json'})
+		self._http.mount('https://', HTTPAdapter(max_retries=Retry(
+			total=3, backoff_factor=0.5,
+			status_forcelist=(429, 500, 502, 503, 504))))
+		# Per-proposal extraction results keyed by (sub-unit, proposal id);
+		# passed proposals are immutable so Streamlit reruns hit the cache.
+		self._proposal_cache = {}
+		# Parsed timestamps keyed by their raw value (see _parse_date)
+		self._date_parse_cache = {}
+		# Resolved pricing-index key per raw symbol (None for known misses);
+		# the candidate walk in _lookup_usd_price runs once per symbol.
+		self._symbol_key_cache = {}
+		# Dispatch table for message container shapes: first matching key wins,
+		# so the walker does one .get per candidate instead of re-testing every
+		# shape with `in` + isinstance for every message.
+		self._msg_handlers = (
+			('funds', list, self._extract_funds),
+			('amount', list, self._extract_coin_list),
+			('coins', list, self._extract_coin_list),
+			('transfers', list, self._extract_transfers),
+			('wasm', dict, self._extract_wasm),
+			('stargate', dict, self._extract_stargate),
+		)
+		# Precompute per-denom metadata once: the 10**decimals divisor (decimals
+		# only take a handful of distinct values) and the display symbol, so the
+		# processing path never traverses token_data per row or per call.
+		self._decimal_factors = {}
+		self._symbol_map = {}
+		for denom, info in self.token_data.items():
+			try:
+				self._decimal_factors[denom] = float(10 ** int(info.get('decimals', 0) or 0))
+			except Exception:
+				self._decimal_factors[denom] = 1.0
+			self._symbol_map[denom] = info.get('symbol') or denom
+		# Single alternation over all known symbols: salvaging a symbol out of
+		# an unmapped denom is one regex scan instead of a walk over token_data.
+		known_symbols = {s.upper() for s in self._symbol_map.values() if s}
+		if known_symbols:
+			self._symbols_re = re.compile('|'.join(re.escape(s) for s in sorted(known_symbols, key=len, reverse=True)))
+		else:
+			self._symbols_re = None
 
 	def _load_pricing_data(self):
-		"""Load combined pricing JSON files from attached_assets or pagedata."""
+		"""Load combined pricing JSON files from attached_assets or pagedata.
+
+		Cached on the instance: the pricing table and the pricing index are
+		both derived from this dict, and without the cache each would pay the
+		full disk walk and JSON parse separately.
+		"""
+		if self._combined_prices is not None:
+			return self._combined_prices
 		search_paths = [
 			"attached_assets/combined_daily_prices_1756000184191.json",
 			"attached_assets/osmo_secret_daily_prices.json",
@@ -24,235 +207,582 @@ class DataProcessor:
 		for p in search_paths:
 			if os.path.exists(p):
 				try:
-					with open(p, 'r', encoding='utf-8') as f:
-						data = json.load(f)
-						if isinstance(data, dict):
-							combined.update(data)
+					with open(p, 'rb') as f:
+						if ijson is not None:
+							# Stream top-level (symbol -> {date: price}) pairs
+							# instead of materializing the whole document
+							for symbol, series in ijson.kvitems(f, ''):
+								if isinstance(series, dict):
+									combined[symbol] = series
+						else:
+							data = _json_loads(f.read())
+							if isinstance(data, dict):
+								combined.update(data)
 				except Exception:
 					continue
+		self._combined_prices = combined
 		return combined
 
-	def _convert_token_amount(self, amount, decimals):
-		try:
-			if pd.isna(amount):
-				return 0
-		except Exception:
-			pass
-		try:
-			return float(amount) / (10 ** int(decimals))
-		except Exception:
-			try:
-				return float(amount)
-			except Exception:
-				return 0
+	def _prices_table(self):
+		"""Flattened (Price Key, _price_date, USD Price) pricing table.
 
-	def _lookup_usd_price(self, symbol, date):
-		# date is a string like '2023-01-02' or datetime
+		Built once per processor and reused by every merge; sorted by date as
+		merge_asof requires.
+		"""
+		if self._prices_df is None:
+			price_rows = [(sym, dk, px) for sym, series in self._load_pricing_data().items()
+						  if isinstance(series, dict) for dk, px in series.items()]
+			prices_df = pd.DataFrame(price_rows, columns=['Price Key', '_price_date', 'USD Price'])
+			if not prices_df.empty:
+				prices_df['_price_date'] = pd.to_datetime(prices_df['_price_date'], errors='coerce')
+				prices_df['USD Price'] = pd.to_numeric(prices_df['USD Price'], errors='coerce')
+				prices_df = prices_df.dropna(subset=['_price_date', 'USD Price'])
+				# Forward-fill each symbol to a continuous daily series once at
+				# load, so date joins land on an exact row instead of leaning
+				# on nearest-neighbor search for every gap.
+				filled = []
+				for key, grp in prices_df.groupby('Price Key'):
+					s = grp.set_index('_price_date')['USD Price'].sort_index()
+					s = s[~s.index.duplicated(keep='last')]
+					if len(s) > 1:
+						s = s.resample('D').ffill()
+					filled.append(pd.DataFrame(
+						{'Price Key': key, '_price_date': s.index, 'USD Price': s.to_numpy()}))
+				prices_df = pd.concat(filled, ignore_index=True).sort_values('_price_date')
+			self._prices_df = prices_df
+		return self._prices_df
+
+	def _pricing_index(self):
+		"""Load pricing data once and precompute per-symbol sorted date views.
+
+		Returns {symbol: (prices, sorted_keys, ordinals)} where sorted_keys and
+		ordinals are parallel tuples parsed a single time at build; every
+		lookup afterwards reuses them instead of re-parsing date keys.
+		"""
+		if self._price_index is None:
+			index = {}
+			for symbol, prices in self._load_pricing_data().items():
+				if not isinstance(prices, dict) or not prices:
+					continue
+				parsed = []
+				for key in sorted(prices.keys()):
+					try:
+						parsed.append((datetime.strptime(key, '%Y-%m-%d').toordinal(), key))
+					except ValueError:
+						continue
+				# Interned keys make the per-lookup dict probes pointer
+				# comparisons instead of full string compares
+				index[sys.intern(str(symbol))] = (prices,
+												  tuple(sys.intern(k) for _, k in parsed),
+												  tuple(o for o, _ in parsed))
+			self._price_index = index
+		return self._price_index
+
+	def _prefetch_prices(self, pairs):
+		"""Warm the price cache for many (symbol, date) pairs concurrently."""
+		if len(pairs) <= 1:
+			return
+		# Build the index up front so the workers don't race to create it
+		self._pricing_index()
+		with ThreadPoolExecutor(max_workers=8) as pool:
+			list(pool.map(lambda pair: self._lookup_usd_price(*pair), pairs))
+
+	def _lookup_usd_price(self, symbol, date_key):
+		# date_key is a pre-formatted 'YYYY-MM-DD' string; callers parse the
+		# proposal date once instead of re-normalizing it here per row.
 		if not symbol:
 			return None
-		if isinstance(date, datetime):
-			date_key = date.strftime('%Y-%m-%d')
-		else:
+		if not isinstance(date_key, str):
 			try:
-				date_key = pd.to_datetime(date).strftime('%Y-%m-%d')
+				date_key = pd.to_datetime(date_key).strftime('%Y-%m-%d')
 			except Exception:
-				date_key = str(date)
+				date_key = str(date_key)
 
 		# Use the cached price if available
 		if (symbol, date_key) in self.price_cache:
 			return self.price_cache[(symbol, date_key)]
 
-		# Try to read from combined pricing JSONs
-		combined = self._load_pricing_data()
-		if symbol in combined:
-			symbol_prices = combined.get(symbol, {})
-			if date_key in symbol_prices:
-				price = symbol_prices.get(date_key)
-				try:
-					price_f = float(price)
+		# Try the pre-indexed pricing data. Resolution is deterministic per
+		# symbol, so walk the candidate variants once and remember the winner
+		# (or the miss); later rows do a single cache probe plus direct index.
+		index = self._pricing_index()
+		if symbol in self._symbol_key_cache:
+			resolved = self._symbol_key_cache[symbol]
+			entry = index.get(resolved) if resolved is not None else None
+		else:
+			resolved = symbol if symbol in index else None
+			if resolved is None and isinstance(symbol, str):
+				# Retry under a normalized key; the isalnum check skips the
+				# regex for symbols that are already clean.
+				cleaned = symbol if symbol.isalnum() else _NON_ALNUM_RE.sub('', symbol)
+				cleaned = cleaned.upper()
+				if cleaned in index:
+					resolved = cleaned
+				else:
+					alias = _SYMBOL_ALIASES.get(symbol.lower())
+					if alias is not None and alias in index:
+						resolved = alias
+			self._symbol_key_cache[symbol] = resolved
+			entry = index.get(resolved) if resolved is not None else None
+		if entry is not None:
+			prices, keys, ordinals = entry
+			if date_key in prices:
+				price_f = _as_float(prices[date_key])
+				if price_f is not None:
 					self.price_cache[(symbol, date_key)] = price_f
 					return price_f
-				except Exception:
-					pass
+			elif keys:
+				# Nearest-date fallback: binary search the pre-parsed ordinals
+				# instead of scanning every date key
+				try:
+					target = datetime.strptime(date_key, '%Y-%m-%d').toordinal()
+				except ValueError:
+					target = None
+				if target is not None:
+					i = bisect.bisect_left(ordinals, target)
+					if i == 0:
+						nearest = keys[0]
+					elif i == len(ordinals):
+						nearest = keys[-1]
+					else:
+						nearest = keys[i] if (ordinals[i] - target) < (target - ordinals[i - 1]) else keys[i - 1]
+					price_f = _as_float(prices[nearest])
+					if price_f is not None:
+						self.price_cache[(symbol, date_key)] = price_f
+						return price_f
 
 		# Fallback: try Coingecko simple API for a recent price
 		# Note: this is a best effort; not all tokens are on coingecko under the same symbol.
+		cg_id = _CG_ID_MAP.get(str(symbol).upper(), symbol)
 		try:
-			url = f"https://api.coingecko.com/api/v3/simple/price?ids={symbol}&vs_currencies=usd"
-			r = requests.get(url, timeout=10)
+			url = f"https://api.coingecko.com/api/v3/simple/price?ids={cg_id}&vs_currencies=usd"
+			r = self._http.get(url, timeout=10)
 			r.raise_for_status()
 			data = r.json()
-			if symbol in data and 'usd' in data[symbol]:
-				price = float(data[symbol]['usd'])
+		except (requests.RequestException, ValueError):
+			data = None
+		if isinstance(data, dict):
+			# Predicate-guarded walk instead of membership tests + indexing; a
+			# malformed payload falls through without raising.
+			per_symbol = data.get(cg_id)
+			price = _as_float(per_symbol.get('usd')) if isinstance(per_symbol, dict) else None
+			if price is not None:
 				self.price_cache[(symbol, date_key)] = price
 				return price
-		except Exception:
-			pass
 
-		# Not found
+		# Negative-cache the miss so repeated (symbol, date) pairs don't
+		# re-issue the network round-trip.
+		self.price_cache[(symbol, date_key)] = None
 		return None
 
+	def _decode_wasm_msg(self, value):
+		"""Decode a base64-encoded wasm execute msg into a dict, or None."""
+		try:
+			decoded = _json_loads(_b64decode(value))
+			return decoded if isinstance(decoded, dict) else None
+		except Exception:
+			return None
+
+	def _extract_funds(self, m, value, recipients, amounts):
+		for f in value:
+			recipients.append(m.get('to_address') or m.get('recipient') or f.get('recipient') or m.get('address'))
+			amounts.append((f.get('amount') or f.get('value') or f.get('coin', {}).get('amount'),
+						   f.get('denom') or f.get('token') or f.get('coin', {}).get('denom')))
+
+	def _extract_coin_list(self, m, value, recipients, amounts):
+		for f in value:
+			recipients.append(m.get('recipient') or m.get('to_address') or m.get('address'))
+			amounts.append((f.get('amount') or f.get('value'), f.get('denom') or f.get('token')))
+
+	def _extract_transfers(self, m, value, recipients, amounts):
+		for t in value:
+			recipients.append(t.get('to') or t.get('recipient') or t.get('address'))
+			amounts.append((t.get('amount'), t.get('denom') or t.get('token')))
+
+	def _extract_wasm(self, m, value, recipients, amounts):
+		# wasm execute messages carry a base64-encoded inner msg;
+		# decode it once to recover cw20 transfer payments
+		execute = value.get('execute') or {}
+		for f in execute.get('funds') or []:
+			recipients.append(execute.get('contract_addr'))
+			amounts.append((f.get('amount'), f.get('denom')))
+		inner = self._decode_wasm_msg(execute.get('msg')) if execute.get('msg') else None
+		if inner:
+			transfer = inner.get('transfer') or inner.get('send') or {}
+			if isinstance(transfer, dict) and transfer.get('amount'):
+				# cw20 amounts are denominated in the token contract
+				recipients.append(transfer.get('recipient') or transfer.get('contract'))
+				amounts.append((transfer.get('amount'), execute.get('contract_addr')))
+
+	def _extract_stargate(self, m, value, recipients, amounts):
+		# Lazy decode: only bank send messages can carry payments, so the
+		# type_url gates the base64 decode and scan of every other blob.
+		type_url = value.get('type_url') or value.get('typeUrl') or ''
+		if 'MsgSend' not in type_url and 'bank' not in type_url:
+			return
+		try:
+			decoded = _b64decode(value.get('value') or '')
+		except Exception:
+			return
+		text = decoded.decode('utf-8', errors='ignore')
+		addrs = _ADDR_RE.findall(text)
+		amts = _AMT_RE.findall(text)
+		if addrs:
+			# MsgSend encodes (from_address, to_address, amount) in order, so
+			# the recipient is the last address in the blob
+			rec = addrs[-1]
+			if amts:
+				for amt, den in amts:
+					recipients.append(rec)
+					amounts.append((amt, den))
+			else:
+				recipients.append(rec)
+				amounts.append((None, None))
+
+	def _proposal_messages(self, proposal):
+		"""Return the proposal's message list, reading each candidate key once.
+
+		Indexer responses sometimes nest the payload under a 'proposal' key and
+		occasionally hand back a single message dict instead of a list; both
+		shapes normalize here so the walker never re-checks them.
+		"""
+		inner = proposal.get('proposal')
+		sources = (proposal, inner) if isinstance(inner, dict) else (proposal,)
+		for src in sources:
+			for key in ('messages', 'msgs', 'actions'):
+				msgs = src.get(key)
+				if isinstance(msgs, list):
+					return msgs
+				if isinstance(msgs, dict):
+					return [msgs]
+		return []
+
+	def _parse_date(self, raw):
+		"""pd.to_datetime with a small cache; timestamps repeat across proposals."""
+		key = raw if isinstance(raw, (str, int, float)) else None
+		if key is not None and key in self._date_parse_cache:
+			return self._date_parse_cache[key]
+		# errors='coerce' turns unparseable input into NaT instead of raising,
+		# so garbage rows never pay exception-unwind cost. utc=True normalizes
+		# tz-aware ISO strings and naive date-only strings to one tz-aware
+		# form — mixing them in a column makes later vectorized to_datetime
+		# calls coerce valid rows to NaT.
+		parsed = pd.to_datetime(raw, errors='coerce', utc=True)
+		if parsed is pd.NaT:
+			parsed = None
+		if key is not None:
+			self._date_parse_cache[key] = parsed
+		return parsed
+
 	def _extract_proposal_date(self, proposal):
 		# Try several fields for a proposal date
-		for key in ['final_queued_at', 'submission_time', 'created_at', 'start_time', 'timestamp']:
-			if key in proposal and proposal.get(key):
-				try:
-					return pd.to_datetime(proposal.get(key))
-				except Exception:
-					continue
+		for key in ('final_queued_at', 'submission_time', 'created_at', 'start_time', 'timestamp'):
+			raw = proposal.get(key)
+			if raw:
+				parsed = self._parse_date(raw)
+				if parsed is not None:
+					return parsed
 		# Try nested
-		if 'metadata' in proposal and isinstance(proposal['metadata'], dict):
-			if 'created_at' in proposal['metadata']:
-				try:
-					return pd.to_datetime(proposal['metadata']['created_at'])
-				except Exception:
-					pass
+		metadata = proposal.get('metadata')
+		if isinstance(metadata, dict) and metadata.get('created_at'):
+			return self._parse_date(metadata['created_at'])
 		return None
 
 	def process_all_proposals(self, proposals_by_subdao):
 		"""Takes a dict: { 'SubDAO Name': {'address': addr, 'proposals': [...] } }
 		   Returns a pandas DataFrame of normalized transactions with USD conversion.
 		"""
-		rows = []
-		combined_prices = self._load_pricing_data()
-
+		# Accumulate column-wise (one list per column) so DataFrame construction
+		# is a direct handoff instead of pandas transposing a list of dicts with
+		# the same key strings repeated per row.
+		self.diagnostics = {'proposals_scanned': 0, 'messages_scanned': 0}
+
+		# Flush the accumulator into a small frame every N proposals so peak
+		# memory stays around one chunk of Python lists plus the final concat,
+		# instead of all payments living twice (lists + DataFrame buffers).
+		frames = []
+		columns = {name: [] for name in _PAYMENT_COLUMNS}
+		pending = 0
 		for subunit_name, payload in proposals_by_subdao.items():
 			proposals = payload.get('proposals') if isinstance(payload, dict) else []
 			for p in proposals:
-				p_date = self._extract_proposal_date(p)
-				proposal_id = p.get('proposal_id') or p.get('id') or p.get('proposal_id')
-				title = p.get('title') or p.get('metadata', {}).get('title') if isinstance(p.get('metadata'), dict) else p.get('title')
-
-				# messages could be in different shapes
-				msgs = []
-				if 'messages' in p and isinstance(p['messages'], list):
-					msgs = p['messages']
-				elif 'msgs' in p and isinstance(p['msgs'], list):
-					msgs = p['msgs']
-				else:
-					# try to find from 'actions' or 'msgs'
-					if 'actions' in p and isinstance(p['actions'], list):
-						msgs = p['actions']
-
-				# When messages include funds or multiple recipients, expand per recipient
-				for m in msgs:
-					# Filter out wasm_execute_funds
-					mtype = m.get('type') or m.get('@type') or m.get('msg_type') or m.get('action')
-					mtype_str = str(mtype) if mtype else ''
-					if 'wasm_execute_funds' in mtype_str:
-						continue
-
-					# Normalized recipient and amounts
-					recipients = []
-					amounts = []
-
-					# Messages may have 'funds', 'amount', 'coins', 'transfers', or nested messages
-					if isinstance(m, dict):
-						# common key names
-						if 'funds' in m and isinstance(m['funds'], list):
-							for f in m['funds']:
-								recipients.append(m.get('to_address') or m.get('recipient') or f.get('recipient') or m.get('address'))
-								amounts.append((f.get('amount') or f.get('value') or f.get('coin', {}).get('amount'), f.get('denom') or f.get('token') or f.get('coin', {}).get('denom')))
-						elif 'amount' in m and isinstance(m['amount'], list):
-							for f in m['amount']:
-								recipients.append(m.get('recipient') or m.get('to_address') or m.get('address'))
-								amounts.append((f.get('amount') or f.get('value'), f.get('denom') or f.get('token')))
-						elif 'coins' in m and isinstance(m['coins'], list):
-							for f in m['coins']:
-								recipients.append(m.get('recipient') or m.get('to_address') or m.get('address'))
-								amounts.append((f.get('amount') or f.get('value'), f.get('denom') or f.get('token')))
-						elif 'transfers' in m and isinstance(m['transfers'], list):
-							for t in m['transfers']:
-								recipients.append(t.get('to') or t.get('recipient') or t.get('address'))
-								amounts.append((t.get('amount'), t.get('denom') or t.get('token')))
-						else:
-							# try to detect single recipient + amount fields
-							recipient = m.get('recipient') or m.get('to') or m.get('to_address') or m.get('address')
-							if 'amount' in m and (isinstance(m['amount'], (str, int, float)) or isinstance(m['amount'], dict)):
-								amt = m['amount']
-								if isinstance(amt, dict):
-									# try to pull denom/amount
-									a = amt.get('amount') or amt.get('value')
-									d = amt.get('denom') or amt.get('denomination')
-									amounts.append((a, d))
-								else:
-									amounts.append((amt, m.get('denom') or m.get('token')))
-									recipients.append(recipient)
-							else:
-								# Nothing obvious; create a placeholder entry so it can be inspected
-								recipients.append(recipient)
-								amounts.append((None, None))
-
-					# If there were no recipients discovered, skip
-					if not recipients:
-						continue
-
-					# Now expand recipients/amounts coherently
-					for i, rec in enumerate(recipients):
-						amt_pair = amounts[i] if i < len(amounts) else (None, None)
-						raw_amount, denom = amt_pair
-
-						decimals = 0
-						symbol = denom
-						# Map denom to symbol if token metadata available
-						if denom and self.token_data and denom in self.token_data:
-							token_meta = self.token_data.get(denom, {})
-							symbol = token_meta.get('symbol', denom)
-							decimals = token_meta.get('decimals', 0)
-
-						token_amount = self._convert_token_amount(raw_amount, decimals)
-
-						usd_price = None
-						if symbol:
-							usd_price = self._lookup_usd_price(symbol, p_date or datetime.now())
-
-						usd_value = None
-						if usd_price is not None and token_amount is not None:
-							try:
-								usd_value = float(token_amount) * float(usd_price)
-							except Exception:
-								usd_value = None
-
-						# Determine recipient type
-						recipient_type = 'Unknown'
-						if rec in self.core_team_addresses:
-							recipient_type = 'Core Team'
-						elif isinstance(rec, str) and rec.startswith('osmo'):
-							recipient_type = 'On-Chain Address'
-
-						rows.append({
-							'Proposal Date': p_date,
-							'Proposal ID': proposal_id,
-							'Proposal Title': title,
-							'Sub-unit': subunit_name,
-							'Org Unit': subunit_name,
-							'Recipient': rec,
-							'Recipient Type': recipient_type,
-							'Message Type': mtype_str,
-							'Token Amount': token_amount,
-							'Token Denom': denom,
-							'Token Symbol': symbol,
-							'USD Price': usd_price,
-							'USD Value': usd_value,
-						})
+				extracted = self.extract_payments_from_proposal(subunit_name, p)
+				for name in _PAYMENT_COLUMNS:
+					columns[name].extend(extracted[name])
+				pending += 1
+				if pending >= self._chunk_size:
+					if columns['Recipient']:
+						frames.append(pd.DataFrame(columns))
+					columns = {name: [] for name in _PAYMENT_COLUMNS}
+					pending = 0
+		if columns['Recipient']:
+			frames.append(pd.DataFrame(columns))
 
 		# Build DataFrame
-		if not rows:
+		if not frames:
 			return pd.DataFrame()
 
-		df = pd.DataFrame(rows)
+		df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True, copy=False)
+		return self._finalize_dataframe(df)
+
+	def extract_payments_from_proposal(self, subunit_name, p):
+		"""Extract normalized payment rows (dict of column lists) from one proposal.
 
+		Results are memoized by (sub-unit, proposal id): passed proposals never
+		change, and Streamlit reruns feed identical payloads back in.
+		"""
+		proposal_id = _first(p, ('proposal_id', 'id', 'proposalId'))
+		cache_key = (subunit_name, proposal_id)
+		if proposal_id is not None and cache_key in self._proposal_cache:
+			return self._proposal_cache[cache_key]
+
+		columns = {name: [] for name in _PAYMENT_COLUMNS}
+		# Bind the column appends once; every row of this proposal shares the
+		# same base fields, so the loop below never re-indexes the dict.
+		appenders = tuple(columns[name].append for name in _PAYMENT_COLUMNS)
+
+		p_date = self._extract_proposal_date(p)
+		# Format the pricing key once per proposal, not once per payment row
+		try:
+			p_date_key = p_date.strftime('%Y-%m-%d') if p_date is not None else datetime.now().strftime('%Y-%m-%d')
+		except Exception:
+			p_date_key = datetime.now().strftime('%Y-%m-%d')
+		# The same key is shared by every row of the proposal and compared in
+		# the pricing caches; interning makes those probes pointer checks
+		p_date_key = sys.intern(p_date_key)
+		title = p.get('title') or (p['metadata'].get('title') if isinstance(p.get('metadata'), dict) else None)
+
+		# messages could be in different shapes
+		msgs = self._proposal_messages(p)
+		self.diagnostics['proposals_scanned'] += 1
+		self.diagnostics['messages_scanned'] += len(msgs)
+
+		# When messages include funds or multiple recipients, expand per recipient
+		for m in msgs:
+			# Skip internal message types (wasm_execute_funds et al.)
+			mtype = _first(m, ('type', '@type', 'msg_type', 'action'))
+			mtype_str = str(mtype) if mtype else ''
+			if _FILTERED_MSG_RE.search(mtype_str):
+				continue
+
+			# Normalized recipient and amounts
+			recipients = []
+			amounts = []
+
+			# Messages may have 'funds', 'amount', 'coins', 'transfers', or nested messages
+			if isinstance(m, dict):
+				# first matching container shape wins
+				handled = False
+				for key, container_type, handler in self._msg_handlers:
+					value = m.get(key)
+					if isinstance(value, container_type):
+						handler(m, value, recipients, amounts)
+						handled = True
+						break
+				if not handled:
+					# try to detect single recipient + amount fields
+					recipient = _first(m, ('recipient', 'to', 'to_address', 'address'))
+					if 'amount' in m and (isinstance(m['amount'], (str, int, float)) or isinstance(m['amount'], dict)):
+						amt = m['amount']
+						if isinstance(amt, dict):
+							# try to pull denom/amount
+							a = amt.get('amount') or amt.get('value')
+							d = amt.get('denom') or amt.get('denomination')
+							amounts.append((a, d))
+						else:
+							amounts.append((amt, m.get('denom') or m.get('token')))
+							recipients.append(recipient)
+					else:
+						# Nothing obvious; walk the dict directly and scan
+						# string leaves for addresses and coin amounts,
+						# skipping the json.dumps round-trip entirely
+						found_addrs = []
+						found_amts = []
+						for leaf in _iter_str_leaves(m):
+							# cheap substring/charclass guards first: most
+							# leaves hold neither an address nor an amount
+							if 'osmo1' in leaf:
+								found_addrs.extend(_ADDR_RE.findall(leaf))
+							if not leaf.isalpha():
+								found_amts.extend(_AMT_RE.findall(leaf))
+						if found_addrs:
+							for j, addr in enumerate(found_addrs):
+								recipients.append(addr)
+								if j < len(found_amts):
+									amt, den = found_amts[j]
+									amounts.append((amt, den))
+								else:
+									amounts.append((None, None))
+						else:
+							# Placeholder entry so it can be inspected
+							recipients.append(recipient)
+							amounts.append((None, None))
+
+			# If there were no recipients discovered, skip
+			if not recipients:
+				continue
+
+			# Now expand recipients/amounts coherently; amount conversion,
+			# symbol mapping and pricing happen vectorized on the DataFrame
+			for i, rec in enumerate(recipients):
+				amt_pair = amounts[i] if i < len(amounts) else (None, None)
+				raw_amount, denom = amt_pair
+
+				for append, value in zip(appenders, (
+						p_date, p_date_key, proposal_id, title,
+						subunit_name, subunit_name, rec, mtype_str,
+						raw_amount, denom)):
+					append(value)
+
+		if proposal_id is not None:
+			self._proposal_cache[cache_key] = columns
+		return columns
+
+	def _finalize_dataframe(self, df):
+		"""Vectorized normalization, pricing and classification of the payments frame."""
 		# Normalize columns and types
-		# Convert Proposal Date to datetime
+		# Convert Proposal Date to datetime; utc=True matches _parse_date so a
+		# column mixing tz-aware and naive inputs still converts cleanly
 		if 'Proposal Date' in df.columns:
 			try:
-				df['Proposal Date'] = pd.to_datetime(df['Proposal Date'])
+				df['Proposal Date'] = pd.to_datetime(df['Proposal Date'], utc=True)
 			except Exception:
 				pass
 
-		# Remove duplicates
+		# Vectorized amount/symbol derivation: denom -> divisor and denom ->
+		# symbol are single .map passes instead of dict traversals per row.
+		factors = df['Token Denom'].map(self._decimal_factors)
+		# Native micro-denoms (uosmo, ujuno, ...) carry 6 decimals even when
+		# the chainlist metadata is missing; everything else defaults to 1.
+		micro_mask = (factors.isna() & df['Token Denom'].astype(str).str.startswith('u')).to_numpy()
+		# np.where allocates a fresh array: Series.to_numpy() can hand back a
+		# read-only view under copy-on-write, so writing into it raises.
+		factors = np.where(micro_mask, 1e6, factors.fillna(1.0).to_numpy(dtype='float64'))
+		raw_amounts = pd.to_numeric(df['Token Raw Amount'], errors='coerce').fillna(0).to_numpy(dtype='float64')
+		df['Token Amount'] = raw_amounts / factors
+		df['Token Symbol'] = df['Token Denom'].map(self._symbol_map)
+		# Only denoms the map missed run the regex salvage, and only once per
+		# unique denom rather than per row.
+		unmapped = df['Token Symbol'].isna() & df['Token Denom'].notna()
+		if unmapped.any() and self._symbols_re is not None:
+			salvage = {}
+			for d in df.loc[unmapped, 'Token Denom'].unique():
+				ds = str(d)
+				# cw20 rows carry the contract address as the denom, and 'OSMO'
+				# is a substring of every uppercased osmo1... address — salvage
+				# would price unknown cw20 tokens as OSMO. Leave address-shaped
+				# denoms as-is so those rows stay unpriced.
+				if _ADDR_RE.fullmatch(ds):
+					salvage[d] = d
+					continue
+				m = self._symbols_re.search(ds.upper())
+				salvage[d] = m.group(0) if m else d
+			df.loc[unmapped, 'Token Symbol'] = df.loc[unmapped, 'Token Denom'].map(salvage)
+		df['Token Symbol'] = df['Token Symbol'].fillna(df['Token Denom'])
+
+		# Join daily prices column-wise: asof-merge the unique (symbol, date)
+		# pairs against the cached flattened pricing table, matching the
+		# nearest quoted day.
+		prices_df = self._prices_table()
+		if not prices_df.empty:
+			# Resolve each unique symbol to the pricing-table key it matches,
+			# trying raw / upper / path-tail / cleaned variants once per symbol
+			# instead of per row.
+			price_symbols = set(prices_df['Price Key'])
+			key_map = {}
+			for sym in df['Token Symbol'].dropna().unique():
+				s = str(sym)
+				key_map[sym] = s
+				for cand in (s, s.upper(), s.split('/')[-1].upper(), _NON_ALNUM_RE.sub('', s).upper()):
+					if cand in price_symbols:
+						key_map[sym] = cand
+						break
+			price_keys = df['Token Symbol'].map(key_map)
+
+			pairs = pd.DataFrame({'Price Key': price_keys, 'Date Key': df['Date Key']}).drop_duplicates()
+			pairs = pairs[pairs['Price Key'].notna()].copy()
+			pairs['_date'] = pd.to_datetime(pairs['Date Key'], errors='coerce')
+			pairs = pairs.dropna(subset=['_date']).sort_values('_date')
+			merged = pd.merge_asof(pairs, prices_df,
+								   left_on='_date', right_on='_price_date',
+								   by='Price Key', direction='nearest')
+			pair_price = {(s, d): p for s, d, p in zip(
+				merged['Price Key'], merged['Date Key'], merged['USD Price'])}
+			df['USD Price'] = pd.Series(
+				list(zip(price_keys, df['Date Key'])), index=df.index).map(pair_price)
+		else:
+			df['USD Price'] = np.nan
+
+		# Only symbols the local table could not price at all go through the
+		# slower remote fallback, once per unique (symbol, date) pair; the
+		# pairs are prefetched concurrently so the wall cost is a few
+		# overlapped round-trips rather than one per pair.
+		missing = df['USD Price'].isna() & df['Token Symbol'].notna()
+		if missing.any():
+			pairs = [tuple(t) for t in df.loc[missing, ['Token Symbol', 'Date Key']].drop_duplicates().itertuples(index=False)]
+			self._prefetch_prices(pairs)
+			for sym, dk in pairs:
+				price = self._lookup_usd_price(sym, dk)
+				if price is not None:
+					df.loc[missing & (df['Token Symbol'] == sym) & (df['Date Key'] == dk), 'USD Price'] = price
+
+		df['USD Value'] = df['Token Amount'] * df['USD Price']
+
+		# Bin USD amounts once here; the report generator reuses this column
+		# instead of re-cutting the same values per report section.
+		df['Amount Category'] = pd.cut(
+			pd.to_numeric(df['USD Value'], errors='coerce').fillna(0),
+			bins=_USD_RANGE_BINS, labels=_USD_RANGE_LABELS, include_lowest=True)
+
+		# Derive all post-processing columns from one pass over shared arrays:
+		# the recipient masks, category masks and the wasm filter all reuse the
+		# same materialized inputs instead of re-scanning the frame per column.
+		recipients = df['Recipient'].astype(str)
+		msg_types = df['Message Type'].astype(str).str.lower()
+		core_mask = df['Recipient'].isin(self.core_team_addresses).to_numpy()
+		onchain_mask = recipients.str.startswith('osmo').to_numpy()
+		recip_len = recipients.str.len().to_numpy()
+		# 'delegate' also matches 'undelegate'
+		staking_mask = msg_types.str.contains('delegate', na=False).to_numpy()
+
+		# Contract addresses are longer than wallet addresses; distinguish the
+		# two with the precomputed length array rather than per-row checks.
+		df['Recipient Type'] = np.select(
+			[core_mask, onchain_mask & (recip_len > 50), onchain_mask],
+			['Core Team', 'Smart Contract', 'Wallet Address'],
+			default='Unknown')
+		df['Transaction Category'] = np.where(staking_mask, 'Staking', 'Payment')
+
+		# Vectorized transaction tags (message shape | amount band | recipient
+		# shape), joined with ' | ' as the Transaction Tags tab expects.
+		msg_tag = np.select(
+			[msg_types.str.contains('bank', na=False),
+			 msg_types.str.contains('stargate', na=False),
+			 msg_types.str.contains('wasm', na=False)],
+			['Direct Transfer', 'Protocol Operation', 'Smart Contract'],
+			default='Other')
+		# Integer bucketing + label indexing: one digitize pass over the amounts
+		token_amt = pd.to_numeric(df['Token Amount'], errors='coerce').fillna(0).to_numpy()
+		amount_tag = pd.Series(_AMOUNT_TAG_LABELS[np.digitize(token_amt, _AMOUNT_TAG_EDGES)], index=df.index)
+		recipient_tag = np.where(onchain_mask & (recip_len > 50),
+								 'Contract Address',
+								 np.where(onchain_mask, 'Wallet Address', 'External'))
+		df['Transaction Tag'] = pd.Series(msg_tag, index=df.index).str.cat(
+			[amount_tag, pd.Series(recipient_tag, index=df.index)], sep=' | ')
+		# Ensure 'Main DAO' key is preserved in the Sub-unit column if present in the payload
+		df['Sub-unit'] = df['Sub-unit'].fillna('Main DAO')
+
+		# wasm_execute_funds rows never reach the frame: the extraction loop
+		# skips them per message, so re-scanning the whole column here would
+		# only repeat that filter.
+
+		# Remove duplicates on the stable identity key instead of the full row:
+		# pandas only hashes these four columns rather than every cell, and the
+		# result no longer depends on derived columns like tags or USD pricing.
 		if not df.empty:
-			df = df.drop_duplicates()
+			dedup_cols = [c for c in ('Proposal ID', 'Recipient', 'Token Denom', 'Token Amount')
+						  if c in df.columns]
+			df = df.drop_duplicates(subset=dedup_cols, keep='first')
 
 		# Replace NaN USD value with 0 or None depending on needs; keep None so filter can exclude
 		try:
@@ -260,13 +790,16 @@ class DataProcessor:
 		except Exception:
 			pass
 
-		# Add category heuristics
-		df['Transaction Category'] = df['Message Type'].apply(lambda x: 'Staking' if 'delegate' in str(x).lower() or 'undelegate' in str(x).lower() else 'Payment')
-
-		# Ensure 'Main DAO' key is preserved in the Sub-unit column if present in the payload
-		df['Sub-unit'] = df['Sub-unit'].fillna('Main DAO')
-
-		# Final clean: filter out wasm_execute_funds message types (double-check)
-		df = df[~df['Message Type'].astype(str).str.contains('wasm_execute_funds', na=False)]
+		# Low-cardinality string columns as categoricals: cuts memory by an
+		# order of magnitude and speeds up the report generator's groupbys,
+		# which compare int8 codes instead of Python strings. Recipient
+		# qualifies too — the same addresses are paid repeatedly.
+		for col in ('Sub-unit', 'Org Unit', 'Token Denom', 'Token Symbol',
+					'Message Type', 'Recipient Type', 'Transaction Category',
+					'Recipient'):
+			try:
+				df[col] = df[col].astype('category')
+			except Exception:
+				pass
 
 		return df
\ No newline at end of file
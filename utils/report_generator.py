@@ -1,14 +1,187 @@
 import io
+import threading
+
+import numpy as np
 import pandas as pd
-from reportlab.lib.pagesizes import landscape, letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+
+# reportlab is only needed for PDF export; a missing install shouldn't take
+# down the whole report module, so the clear ImportError is deferred until
+# export_to_pdf is actually called.
+try:
+	from reportlab.lib.pagesizes import landscape, letter
+	from reportlab.pdfgen import canvas
+	from reportlab.lib.units import inch
+	from reportlab.lib import colors
+	_HAS_REPORTLAB = True
+except ImportError:
+	_HAS_REPORTLAB = False
+
+# Page geometry is fixed; compute it once instead of per export call
+_PAGE_SIZE = landscape(letter) if _HAS_REPORTLAB else None
+
+# Optional accelerators: pyarrow encodes CSV in C instead of per-cell Python
+# serialization, and orjson is several times faster than pandas' to_json.
+# Both fall back to the pandas writers when not installed.
+try:
+	import pyarrow as pa
+	import pyarrow.csv as pa_csv
+except Exception:
+	pa = None
+	pa_csv = None
+
+try:
+	import orjson
+except Exception:
+	orjson = None
+
+
+def _df_fingerprint(df):
+	"""Cheap content key for a DataFrame: shape, columns and row-hash sum."""
+	if df is None:
+		return None
+	try:
+		return (df.shape, tuple(df.columns),
+				int(pd.util.hash_pandas_object(df, index=False).sum()))
+	except TypeError:
+		return None
+
+
+# Bound on the memoized-result cache: the generator outlives any one dataset
+# (it is process-wide via st.cache_resource), so without eviction the report
+# frames and export bytes for every fingerprint ever seen would accumulate for
+# the server's lifetime. LRU keeps the working set of the datasets currently
+# being viewed.
+_RESULT_CACHE_MAX = 64
+
+
+def _cache_store(cache, key, value):
+	"""Insert into the result cache, evicting least-recently-used entries."""
+	cache[key] = value
+	while len(cache) > _RESULT_CACHE_MAX:
+		cache.pop(next(iter(cache)))
+
+
+def _memoized(method):
+	"""Memoize a report method on its input-frame fingerprint plus args.
+
+	Streamlit reruns call every generator again with the same processed
+	frame; a hit returns the stored result instead of redoing the pandas
+	work. Frames that can't be hashed simply bypass the cache, and the
+	cache itself is LRU-bounded (see _RESULT_CACHE_MAX).
+	"""
+	name = method.__name__
+
+	def wrapper(self, df, *args, **kwargs):
+		fp = self._fingerprint(df)
+		if fp is None:
+			return method(self, df, *args, **kwargs)
+		key = (name, fp, args, tuple(sorted(kwargs.items())))
+		cache = self._result_cache
+		if key in cache:
+			# Re-insert so the hit counts as recently used
+			cache[key] = cache.pop(key)
+			return cache[key]
+		result = method(self, df, *args, **kwargs)
+		_cache_store(cache, key, result)
+		return result
+
+	wrapper.__name__ = name
+	wrapper.__doc__ = method.__doc__
+	return wrapper
+
 
 class ReportGenerator:
 	def __init__(self):
-		pass
+		# LRU-bounded result cache for the memoized generate_* methods and
+		# PDF export (see _RESULT_CACHE_MAX)
+		self._result_cache = {}
+		# GroupBy objects for the most recent input frame, keyed by group
+		# column; a repeated grouping reuses the built hash table instead of
+		# rebuilding it (see _groupby). The frame itself is held as the cache
+		# key: a bare id() would let a dead frame's entries be served for a
+		# new frame allocated at the same address.
+		self._groupby_frame = None
+		self._groupby_cache = {}
+		# Fingerprint of the most recent frame: a rerun calls seven memoized
+		# methods with the same frame, which should hash it once, not seven
+		# times (see _fingerprint). Same held-reference keying as above.
+		self._fp_frame = None
+		self._fp_shape = None
+		self._fp_value = None
+		# The generator is shared process-wide (st.cache_resource) and each
+		# Streamlit session runs in its own thread, so the check-then-act
+		# re-keying of the identity-keyed caches above must be atomic —
+		# otherwise one session could store arrays into a cache another
+		# session just re-keyed to a different frame.
+		self._frame_lock = threading.Lock()
+
+	def _fingerprint(self, df):
+		"""_df_fingerprint with reuse for the most recently seen frame."""
+		if df is None:
+			return None
+		with self._frame_lock:
+			if df is self._fp_frame and df.shape == self._fp_shape:
+				return self._fp_value
+		fp = _df_fingerprint(df)
+		with self._frame_lock:
+			self._fp_frame = df
+			self._fp_shape = df.shape
+			self._fp_value = fp
+		return fp
+
+	def _frame_cache(self, df):
+		"""Per-frame cache dict for df, re-keyed atomically under the lock.
+
+		Callers hold the returned dict directly, so a concurrent re-key by
+		another session's frame leaves them writing values computed from
+		their own frame into a dict only ever keyed to that frame — entries
+		never mix across frames, at worst an orphaned dict is recomputed.
+		"""
+		with self._frame_lock:
+			if df is not self._groupby_frame:
+				self._groupby_frame = df
+				self._groupby_cache = {}
+			return self._groupby_cache
+
+	def _usd_array(self, df):
+		"""NaN-sanitized float ndarray of USD Value, cached per frame.
 
+		Summary stats and insights each need the coerced values; the
+		coercion is one O(n) pass shared through the same per-frame cache
+		the groupby objects use. Returns None when the column is absent.
+		"""
+		cache = self._frame_cache(df)
+		arr = cache.get('_usd_array')
+		if arr is None:
+			if 'USD Value' not in df.columns:
+				return None
+			arr = np.nan_to_num(
+				pd.to_numeric(df['USD Value'], errors='coerce').to_numpy(dtype=float), nan=0.0)
+			cache['_usd_array'] = arr
+		return arr
+
+	def _core_mask(self, df):
+		"""Boolean ndarray of core-team rows, cached per frame like _usd_array."""
+		cache = self._frame_cache(df)
+		mask = cache.get('_core_mask')
+		if mask is None:
+			if 'Recipient Type' not in df.columns:
+				return None
+			mask = (df['Recipient Type'].to_numpy() == 'Core Team')
+			cache['_core_mask'] = mask
+		return mask
+
+	def _groupby(self, df, key, sort=False, observed=True):
+		"""df.groupby(key) with per-frame reuse of the grouping object."""
+		cache = self._frame_cache(df)
+		cache_key = (key, sort, observed)
+		gb = cache.get(cache_key)
+		if gb is None:
+			gb = df.groupby(key, sort=sort, observed=observed)
+			cache[cache_key] = gb
+		return gb
+
+	@_memoized
 	def generate_summary_stats(self, df: pd.DataFrame):
 		if df is None or df.empty:
 			return {
@@ -19,11 +192,16 @@ class ReportGenerator:
 				'subunits_count': 0
 			}
 
+		cols = set(df.columns)
 		total_payments = len(df)
-		total_usd_value = df['USD Value'].dropna().sum() if 'USD Value' in df.columns else 0
-		total_amount_osmo = df['Token Amount'].dropna().sum() if 'Token Amount' in df.columns else 0
-		core_team_payments = len(df[df['Recipient Type'] == 'Core Team']) if 'Recipient Type' in df.columns else 0
-		subunits_count = df['Sub-unit'].nunique() if 'Sub-unit' in df.columns else 0
+		# Sums skip NaN natively and the core-team count is a boolean-mask
+		# sum, so nothing here materializes a filtered frame or dropna copy.
+		usd = self._usd_array(df)
+		total_usd_value = usd.sum() if usd is not None else 0
+		total_amount_osmo = pd.to_numeric(df['Token Amount'], errors='coerce').sum() if 'Token Amount' in cols else 0
+		core_mask = self._core_mask(df)
+		core_team_payments = int(core_mask.sum()) if core_mask is not None else 0
+		subunits_count = df['Sub-unit'].nunique() if 'Sub-unit' in cols else 0
 
 		return {
 			'total_payments': total_payments,
@@ -33,122 +211,255 @@ class ReportGenerator:
 			'subunits_count': subunits_count
 		}
 
+	@_memoized
 	def generate_transaction_insights(self, df: pd.DataFrame):
 		if df is None or df.empty:
 			return {}
 		insights = {}
-		# largest transaction
-		if 'USD Value' in df.columns and df['USD Value'].notna().any():
-			try:
-				largest = df.loc[df['USD Value'].idxmax()].to_dict()
-				insights['largest_transaction'] = largest
-			except Exception:
-				pass
+		# Pull USD values out as one float ndarray; every insight below reads
+		# it instead of re-filtering the DataFrame.
+		# Sanitized once per frame and shared with generate_summary_stats;
+		# every reduction below is then a plain C-level sum/argmax. USD
+		# values are non-negative, so zeroed NaNs preserve argmax and sums.
+		usd = self._usd_array(df)
 
-		# most frequent recipient
+		# largest transaction: C-level argmax, then one positional row read
+		if usd is not None and len(usd) and usd.max() > 0:
+			insights['largest_transaction'] = df.iloc[int(np.argmax(usd))].to_dict()
+
+		# most frequent recipient: the processor emits Recipient as a
+		# categorical, so counting is a bincount over the integer codes —
+		# one linear pass, no hash table — and the winner's USD total is a
+		# masked sum over the shared array. Non-categorical input falls back
+		# to a single grouped pass.
 		try:
-			freq = df.groupby('Recipient').agg({'USD Value': ['sum', 'count']}).reset_index()
-			freq.columns = ['Recipient', 'Total USD', 'Count']
-			freq = freq.sort_values('Total USD', ascending=False)
-			if not freq.empty:
-				insights['most_frequent_recipient'] = freq.iloc[0].to_dict()
+			rec = df['Recipient'] if 'Recipient' in df.columns else None
+			if rec is not None and isinstance(rec.dtype, pd.CategoricalDtype) and len(rec.cat.categories):
+				codes = rec.cat.codes.to_numpy()
+				counts = np.bincount(codes[codes >= 0], minlength=len(rec.cat.categories))
+				top = int(np.argmax(counts))
+				total = float(usd[codes == top].sum()) if usd is not None else 0.0
+				insights['most_frequent_recipient'] = {
+					'Recipient': rec.cat.categories[top],
+					'count': int(counts[top]),
+					'total_usd': total,
+				}
+			elif rec is not None:
+				g = self._groupby(df, 'Recipient')['USD Value'].agg(count='size', total='sum')
+				if len(g):
+					counts = g['count'].to_numpy()
+					top = int(np.argmax(counts))
+					insights['most_frequent_recipient'] = {
+						'Recipient': g.index[top],
+						'count': int(counts[top]),
+						'total_usd': float(g['total'].to_numpy()[top]),
+					}
 		except Exception:
 			pass
 
-		# core team pct
-		try:
-			total_usd = df['USD Value'].dropna().sum() if 'USD Value' in df.columns else 0
-			core_usd = df[df['Recipient Type'] == 'Core Team']['USD Value'].dropna().sum() if 'Recipient Type' in df.columns and 'USD Value' in df.columns else 0
-			insights['core_team_percentage'] = (core_usd / total_usd * 100) if total_usd and core_usd else 0
-		except Exception:
-			insights['core_team_percentage'] = 0
+		# core team pct: boolean mask over the shared ndarray
+		core_pct = 0
+		core_mask = self._core_mask(df)
+		if usd is not None and core_mask is not None:
+			total_usd = usd.sum()
+			if total_usd:
+				core_usd = usd[core_mask].sum()
+				if core_usd:
+					core_pct = core_usd / total_usd * 100
+		insights['core_team_percentage'] = float(core_pct)
 
 		return insights
 
+	@_memoized
 	def generate_subunit_summary(self, df: pd.DataFrame):
 		if df is None or df.empty:
 			return pd.DataFrame()
 		if 'USD Value' not in df.columns:
 			return pd.DataFrame()
 		try:
-			summary = df.groupby('Sub-unit').agg({'USD Value': ['sum', 'count']}).round(2)
-			summary.columns = ['Total USD', 'Transactions']
+			# Single named-aggregation pass; the core-team count rides along as
+			# a vectorized boolean column instead of a per-group Python lambda.
+			aggs = {'Total USD': ('USD Value', 'sum'),
+					'Transactions': ('USD Value', 'count')}
+			core_mask = self._core_mask(df)
+			if core_mask is not None:
+				# Group the temporary assign()ed frame directly: routing it
+				# through _groupby would re-key the shared per-frame cache to a
+				# frame that dies at method exit.
+				aggs['Core Team Payments'] = ('_is_core', 'sum')
+				summary = df.assign(_is_core=core_mask).groupby(
+					'Sub-unit', sort=False, observed=True).agg(**aggs)
+			else:
+				summary = self._groupby(df, 'Sub-unit').agg(**aggs)
+			# Mean derived from the sum and count already computed instead of
+			# asking groupby for a third walk over the data
+			counts = summary['Transactions'].to_numpy(dtype=float)
+			summary['Average USD'] = np.divide(
+				summary['Total USD'].to_numpy(), counts,
+				out=np.zeros_like(counts), where=counts > 0)
 			summary = summary.reset_index().sort_values('Total USD', ascending=False)
 			return summary
 		except Exception:
 			return pd.DataFrame()
 
+	@_memoized
 	def generate_category_breakdown(self, df: pd.DataFrame):
 		if df is None or df.empty or 'Transaction Category' not in df.columns:
 			return pd.DataFrame()
 		try:
-			c = df.groupby('Transaction Category').agg({'USD Value': 'sum', 'Proposal ID': 'count'}).round(2)
-			c.columns = ['Total USD', 'Transactions']
+			c = self._groupby(df, 'Transaction Category').agg(
+				**{'Total USD': ('USD Value', 'sum'), 'Transactions': ('Proposal ID', 'count')})
 			c = c.reset_index().sort_values('Total USD', ascending=False)
 			return c
 		except Exception:
 			return pd.DataFrame()
 
+	@_memoized
 	def generate_amount_range_analysis(self, df: pd.DataFrame):
 		if df is None or df.empty or 'USD Value' not in df.columns:
 			return pd.DataFrame()
 		try:
-			bins = [0, 100, 1000, 10000, 100000, 1_000_000_000]
-			labels = ['0-100', '100-1k', '1k-10k', '10k-100k', '100k+']
-			df['Amount Category'] = pd.cut(df['USD Value'].fillna(0), bins=bins, labels=labels, include_lowest=True)
-			a = df.groupby('Amount Category').agg({'USD Value': ['sum', 'count']}).round(2)
-			a.columns = ['Total USD', 'Number of Transactions']
+			# The processor already bins USD values into Amount Category; only
+			# re-cut when handed a frame that lacks the column. The re-cut
+			# builds a local two-column frame so the caller's df is never
+			# mutated.
+			if 'Amount Category' not in df.columns:
+				bins = [0, 100, 1000, 10000, 100000, 1_000_000_000]
+				labels = ['0-100', '100-1k', '1k-10k', '10k-100k', '100k+']
+				usd = df['USD Value'].fillna(0)
+				work = pd.DataFrame({
+					'USD Value': usd,
+					'Amount Category': pd.cut(usd, bins=bins, labels=labels, include_lowest=True),
+				})
+				a = work.groupby('Amount Category', sort=True, observed=False).agg(
+					**{'Total USD': ('USD Value', 'sum'), 'Number of Transactions': ('USD Value', 'count')})
+			else:
+				# Amount Category is an ordered Categorical (pd.cut), so a
+				# sorted groupby already emits the bands smallest-to-largest
+				# with no post-hoc sort column needed.
+				a = self._groupby(df, 'Amount Category', sort=True, observed=False).agg(
+					**{'Total USD': ('USD Value', 'sum'), 'Number of Transactions': ('USD Value', 'count')})
 			a = a.reset_index()
 			return a
 		except Exception:
 			return pd.DataFrame()
 
+	@_memoized
 	def generate_core_team_breakdown(self, df: pd.DataFrame):
 		if df is None or df.empty or 'Recipient Type' not in df.columns:
 			return pd.DataFrame()
 		try:
-			core = df.groupby('Recipient Type').agg({'USD Value': ['sum', 'count']}).round(2)
-			core.columns = ['Total USD', 'Number of Transactions']
+			core = self._groupby(df, 'Recipient Type').agg(
+				**{'Total USD': ('USD Value', 'sum'), 'Number of Transactions': ('USD Value', 'count')})
 			core = core.reset_index()
 			return core
 		except Exception:
 			return pd.DataFrame()
 
+	@_memoized
 	def generate_detailed_report(self, df: pd.DataFrame, include_zero_usd=False):
 		if df is None or df.empty:
 			return pd.DataFrame()
-		cols = ['Proposal Date', 'Proposal ID', 'Proposal Title', 'Sub-unit', 'Org Unit', 'Recipient', 'Recipient Type', 'Message Type', 'Token Amount', 'Token Symbol', 'USD Value']
+		# Amount/title/symbol fallbacks are resolved upstream in the processor
+		# (vectorized map + fillna), so the report works against one fixed
+		# schema instead of per-call alternative-column ladders.
+		# 'Org Unit' is deliberately absent: it duplicates Sub-unit upstream,
+		# and selecting both would leave two 'Org Unit' columns after the
+		# display rename below.
+		cols = ['Proposal Date', 'Proposal ID', 'Proposal Title', 'Sub-unit', 'Recipient', 'Recipient Type', 'Message Type', 'Token Amount', 'Token Symbol', 'USD Value']
+		# Set membership instead of repeated O(ncols) Index scans
+		present = set(df.columns)
+		selected = [c for c in cols if c in present]
+		# Push the row filter ahead of the column copy so the copy, date
+		# conversion and dedupe below only touch surviving rows. The wasm
+		# internal rows are already dropped upstream by the processor.
+		if not include_zero_usd and 'USD Value' in present:
+			usd = pd.to_numeric(df['USD Value'], errors='coerce').to_numpy(dtype=float)
+			out = df.loc[usd > 0, selected].copy()
+		else:
+			out = df[selected].copy()
+		# Missing columns are filled on the copy so the caller's frame is
+		# never mutated.
 		for c in cols:
-			if c not in df.columns:
-				df[c] = None
+			if c not in present:
+				out[c] = None
 
-		out = df[cols].copy()
+		# Convert Proposal Date to date-only for display. utc=True keeps a
+		# column that mixes tz-aware and naive values converting row by row
+		# instead of coercing everything after the first element to NaT.
+		out['Proposal Date'] = pd.to_datetime(out['Proposal Date'], errors='coerce', utc=True).dt.date
 
-		# Convert Proposal Date to date-only for display
-		try:
-			out['Proposal Date'] = pd.to_datetime(out['Proposal Date']).dt.date
-		except Exception:
-			pass
-
-		if not include_zero_usd:
-			out = out[(out['USD Value'].notna()) & (out['USD Value'] > 0)]
-
-		# Remove duplicates by Proposal ID + Recipient + Token Amount
-		out = out.drop_duplicates(subset=['Proposal ID', 'Recipient', 'Token Amount'])
+		# Dedup already happened upstream: the processor drops duplicates on
+		# (Proposal ID, Recipient, Token Denom, Token Amount) at finalize, so
+		# repeating a coarser dedup here would only re-hash every row.
 
 		# Rename for user-friendly labels
 		out = out.rename(columns={'Sub-unit': 'Org Unit', 'Token Symbol': 'token_symbol'})
 
 		# Ensure column order per requirement
 		final_cols = ['Proposal Date', 'Proposal ID', 'Proposal Title', 'Org Unit', 'USD Value', 'Recipient', 'Recipient Type', 'Message Type', 'Token Amount', 'token_symbol']
-		out = out[final_cols]
+		return out[final_cols].reset_index(drop=True)
+
+	@_memoized
+	def export_to_csv(self, df: pd.DataFrame) -> bytes:
+		# Bytes end to end: the download widget re-encodes str payloads, so
+		# returning UTF-8 bytes skips a full-size round-trip on big exports.
+		if df is None or df.empty:
+			return b''
+		if pa_csv is not None:
+			try:
+				buf = io.BytesIO()
+				pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+				return buf.getvalue()
+			except Exception:
+				pass
+		return df.to_csv(index=False).encode('utf-8')
+
+	@_memoized
+	def export_to_json(self, df: pd.DataFrame) -> bytes:
+		if df is None or df.empty:
+			return b'[]'
+		if orjson is not None:
+			try:
+				return orjson.dumps(
+					df.to_dict('records'),
+					option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+					default=str)
+			except Exception:
+				pass
+		return df.to_json(orient='records', indent=2).encode('utf-8')
+
+	def export_to_pdf(self, processed_data: pd.DataFrame, detailed_df: pd.DataFrame, title: str = None, include_zero_usd=False, subdaos=None, main_dao=None, core_team=None, proposals_count=0, out=None):
+		"""Build the report PDF.
 
-		return out
+		Cells are drawn as plain pre-rendered strings on the canvas; nothing
+		goes through ReportLab's Paragraph/XML pipeline, which would parse
+		and wrap every tiny cell. Long values are truncated upstream instead.
 
-	def export_to_pdf(self, processed_data: pd.DataFrame, detailed_df: pd.DataFrame, title: str = None, include_zero_usd=False, subdaos=None, main_dao=None, core_team=None, proposals_count=0):
-		buffer = io.BytesIO()
-		c = canvas.Canvas(buffer, pagesize=landscape(letter))
-		width, height = landscape(letter)
+		Returns the PDF bytes, or None when `out` (a binary file-like) is
+		given — then the document streams straight into `out` and never
+		materializes a second full copy in memory.
+		"""
+		if not _HAS_REPORTLAB:
+			raise ImportError("reportlab is required for PDF export")
+		# A frame from generate_detailed_report is trusted as-is: it already
+		# has exactly the output schema, so there is no per-call column
+		# normalization here. Only derive one when the caller didn't.
+		if detailed_df is None and processed_data is not None:
+			detailed_df = self.generate_detailed_report(processed_data, include_zero_usd=include_zero_usd)
+		# Repeated downloads of the same report reuse the already-built bytes
+		cache_key = ('export_to_pdf', _df_fingerprint(detailed_df), title, include_zero_usd,
+					 tuple(subdaos) if subdaos else None, main_dao,
+					 len(core_team) if core_team else 0, proposals_count)
+		cached = self._result_cache.get(cache_key)
+		if cached is not None:
+			if out is not None:
+				out.write(cached)
+				return None
+			return cached
+		buffer = out if out is not None else io.BytesIO()
+		c = canvas.Canvas(buffer, pagesize=_PAGE_SIZE)
+		width, height = _PAGE_SIZE
 
 		# Title
 		c.setFont('Helvetica-Bold', 16)
@@ -180,8 +491,53 @@ class ReportGenerator:
 		if detailed_df is None or detailed_df.empty:
 			c.drawString(1 * inch, y, "No transaction data available")
 		else:
-			# Ensure columns are in expected order
-			for _, row in detailed_df.iterrows():
+			# Format every column once with vectorized string ops; the draw
+			# loop below only positions pre-built strings instead of running
+			# pd.isna + formatting per cell via iterrows.
+			n = len(detailed_df)
+			pdf_cols = set(detailed_df.columns)
+
+			def _text_col(name, width_limit=None):
+				if name not in pdf_cols:
+					return np.full(n, '', dtype=object)
+				# Nullable StringDtype coerces through a C kernel and keeps
+				# missing values as NA for the fillna, instead of astype(str)
+				# calling str() per element and printing 'nan'/'None' cells
+				s = detailed_df[name].astype('string').fillna('').str.replace('\n', ' ', regex=False)
+				if width_limit is not None:
+					# Conditional ellipsis as one masked string kernel, not a
+					# per-cell lambda; short cells pass through untouched.
+					over = s.str.len() > width_limit
+					if over.any():
+						s = s.where(~over, s.str.slice(0, width_limit - 3) + '...')
+				return s.to_numpy(dtype=object)
+
+			if 'USD Value' in pdf_cols:
+				usd_strs = pd.to_numeric(detailed_df['USD Value'], errors='coerce').map(
+					'${:,.2f}'.format, na_action='ignore').fillna('').to_numpy(dtype=object)
+			else:
+				usd_strs = np.full(n, '', dtype=object)
+
+			if 'Token Amount' in pdf_cols:
+				tok_strs = pd.to_numeric(detailed_df['Token Amount'], errors='coerce').map(
+					'{:,.6f}'.format, na_action='ignore').fillna('').to_numpy(dtype=object)
+			else:
+				tok_strs = np.full(n, '', dtype=object)
+
+			col_arrays = [
+				_text_col('Proposal Date'),
+				_text_col('Proposal ID'),
+				_text_col('Proposal Title', 60),
+				_text_col('Org Unit'),
+				usd_strs,
+				_text_col('Recipient'),
+				_text_col('Recipient Type'),
+				_text_col('Message Type'),
+				tok_strs,
+				_text_col('token_symbol'),
+			]
+
+			for values in zip(*col_arrays):
 				if y < 1 * inch:
 					c.showPage()
 					c.setFont('Helvetica-Bold', 9)
@@ -190,29 +546,17 @@ class ReportGenerator:
 					c.setFont('Helvetica', 8)
 					y = height - 1.2 * inch
 
-				values = [
-					str(row.get('Proposal Date', '')),
-					str(row.get('Proposal ID', '')),
-					str(row.get('Proposal Title', ''))[:60],
-					str(row.get('Org Unit', '')),
-					f"${row.get('USD Value', ''):,.2f}" if row.get('USD Value') is not None else '',
-					str(row.get('Recipient', '')),
-					str(row.get('Recipient Type', '')),
-					str(row.get('Message Type', '')),
-					str(row.get('Token Amount', '')),
-					str(row.get('token_symbol', ''))
-				]
-
 				for v, x in zip(values, x_positions):
-					try:
-						c.drawString(x, y, v)
-					except Exception:
-						# Skip if unable to draw long text
-						pass
+					c.drawString(x, y, v)
 				y -= 0.18 * inch
 				rows_written += 1
 
 		c.showPage()
 		c.save()
+		if out is not None:
+			return None
 		buffer.seek(0)
-		return buffer.getvalue()
\ No newline at end of file
+		pdf_bytes = buffer.getvalue()
+		if cache_key[1] is not None:
+			_cache_store(self._result_cache, cache_key, pdf_bytes)
+		return pdf_bytes
\ No newline at end of file